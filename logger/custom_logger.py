@@ -43,14 +43,18 @@ class CustomLoggerTracker:
         if not os.path.exists(self.base_log_dir):
             os.makedirs(self.base_log_dir)
 
-    def _get_log_path(self, module_name):
-        """Generate the hierarchical path for log files."""
+    def get_log_dir(self, *subdirs):
+        """Today's directory in the log tree (optionally a subdirectory of it), created if missing."""
         now = datetime.now()
         year_dir = os.path.join(self.base_log_dir, str(now.year))
         month_dir = os.path.join(year_dir, f"{now.month:02d}")
-        day_dir = os.path.join(month_dir, f"{now.day:02d}")
+        day_dir = os.path.join(month_dir, f"{now.day:02d}", *subdirs)
         os.makedirs(day_dir, exist_ok=True)
-        return os.path.join(day_dir, f"{module_name}.log")
+        return day_dir
+
+    def _get_log_path(self, module_name):
+        """Generate the hierarchical path for log files."""
+        return os.path.join(self.get_log_dir(), f"{module_name}.log")
 
     def get_logger(self, module_name):
         """Get or create a logger for a specific module."""